@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import copy
 import re
 
 from typing import overload, TypeVar, Dict, Optional
 from typing_extensions import Self, TypeAlias
 from dataclasses import dataclass, field, replace
-from ._utils import _str_detect
+from ._utils import _intern_str, _str_detect
 from ._tbl_data import create_empty_frame, to_list
 
 from ._styles import CellStyle
@@ -43,12 +42,13 @@ class GTData:
     _has_built: bool = False
 
     def _replace(self, **kwargs: Any) -> Self:
-        new_obj = copy.copy(self)
-
-        missing = {k for k in kwargs if k not in new_obj.__dict__}
+        missing = {k for k in kwargs if k not in self.__dict__}
         if missing:
             raise ValueError(f"Replacements not in data: {missing}")
 
+        # shallow copy: all components not being replaced are shared with self
+        new_obj = object.__new__(type(self))
+        new_obj.__dict__.update(self.__dict__)
         new_obj.__dict__.update(kwargs)
 
         return new_obj
@@ -223,6 +223,7 @@ class ColInfo:
 
 class Boxhead(_Sequence[ColInfo]):
     _d: List[ColInfo]
+    _var_index: Optional[Dict[str, int]] = None
 
     def __init__(
         self,
@@ -237,7 +238,7 @@ class Boxhead(_Sequence[ColInfo]):
             # Obtain the column names from the data and initialize the
             # `_boxhead` from that
             column_names = get_column_names(data)
-            self._d = [ColInfo(col) for col in column_names]
+            self._d = [ColInfo(_intern_str(col)) for col in column_names]
         if not isinstance(data, list) and auto_align:
             self.align_from_data(data=data)
 
@@ -269,9 +270,10 @@ class Boxhead(_Sequence[ColInfo]):
 
     def set_cols_hidden(self, colnames: list[str]):
         # TODO: validate that colname is in the boxhead
+        set_cols = set(colnames)
         res: list[ColInfo] = []
         for ii, col in enumerate(self._d):
-            if col.var in colnames:
+            if col.var in set_cols:
                 new_col = replace(col, type=ColInfoTypeEnum.hidden)
                 res.append(new_col)
             else:
@@ -357,14 +359,23 @@ class Boxhead(_Sequence[ColInfo]):
         return [x.var for x in self._d if x.type == type]
 
     def reorder(self, vars: List[str]) -> Self:
-        boxh_vars = [col.var for col in self]
-        if set(vars) != set(boxh_vars):
+        var_index = self.var_index()
+        if set(vars) != var_index.keys():
             raise ValueError("Reordering vars must contain all boxhead vars.")
 
-        new_order = [boxh_vars.index(var) for var in vars]
+        new_order = [var_index[var] for var in vars]
 
         return self[new_order]
 
+    def var_index(self) -> Dict[str, int]:
+        """Return a mapping of each column var to its position in the boxhead."""
+
+        # Column vars never change once a Boxhead is created (methods that
+        # change columns return a new Boxhead), so the mapping is built once
+        if self._var_index is None:
+            self._var_index = {col.var: ii for ii, col in enumerate(self._d)}
+        return self._var_index
+
     # Get a list of columns
     def _get_columns(self) -> List[str]:
         return [x.var for x in self._d]
@@ -686,6 +697,7 @@ class SpannerInfo:
 
 class Spanners(_Sequence[SpannerInfo]):
     _d: list[SpannerInfo]
+    _col_max_level: Optional[Dict[str, int]] = None
 
     @classmethod
     def from_ids(cls, ids: list[str]):
@@ -712,14 +724,36 @@ class Spanners(_Sequence[SpannerInfo]):
         if not len(self):
             return 0
 
-        overlapping_levels = [
-            s.spanner_level for s in self if any(v in column_names for v in s.vars)
-        ]
+        col_max_level = self._get_col_max_level()
+        overlapping_levels = [col_max_level[v] for v in column_names if v in col_max_level]
 
         return max(overlapping_levels, default=-1) + 1
 
     def append_entry(self, span: SpannerInfo) -> Self:
-        return self.__class__(self._d + [span])
+        new_spanners = self.__class__(self._d + [span])
+
+        # carry the column level index forward, rather than rebuilding it
+        if self._col_max_level is not None:
+            col_max_level = self._col_max_level.copy()
+            _update_col_max_level(col_max_level, span)
+            new_spanners._col_max_level = col_max_level
+
+        return new_spanners
+
+    def _get_col_max_level(self) -> Dict[str, int]:
+        # The highest spanner level over each column, built on first use
+        if self._col_max_level is None:
+            col_max_level: Dict[str, int] = {}
+            for span in self._d:
+                _update_col_max_level(col_max_level, span)
+            self._col_max_level = col_max_level
+        return self._col_max_level
+
+
+def _update_col_max_level(col_max_level: Dict[str, int], span: SpannerInfo) -> None:
+    for var in span.vars:
+        if col_max_level.get(var, -1) < span.spanner_level:
+            col_max_level[var] = span.spanner_level
 
 
 # Heading ---
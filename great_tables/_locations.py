@@ -13,6 +13,7 @@ from typing_extensions import TypeAlias
 from ._gt_data import GTData, FootnoteInfo, Spanners, ColInfoTypeEnum, StyleInfo, FootnotePlacement
 from ._tbl_data import eval_select, eval_transform, PlExpr
 from ._styles import CellStyle
+from ._utils import _intern_str
 
 
 if TYPE_CHECKING:
@@ -195,7 +196,7 @@ def resolve_cols_c(
         excl_group=excl_group,
         null_means=null_means,
     )
-    return [name_pos[0] for name_pos in selected]
+    return [_intern_str(name_pos[0]) for name_pos in selected]
 
 
 def resolve_cols_i(
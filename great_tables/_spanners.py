@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ._types import GTSelf
 
 
-SpannerMatrix = List[Dict[str, Union[str, None]]]
+SpannerMatrix = List[List[Union[str, None]]]
 
 
 def tab_spanner(
@@ -117,7 +117,121 @@ def tab_spanner(
     ```
     """
 
-    crnt_spanner_ids = [span.spanner_id for span in data._spanners]
+    spec = dict(
+        label=label,
+        columns=columns,
+        spanners=spanners,
+        level=level,
+        id=id,
+        gather=gather,
+        replace=replace,
+    )
+
+    return tab_spanners_batch(data, [spec])
+
+
+def tab_spanners_batch(data: GTSelf, specs: List[Dict[str, Any]]) -> GTSelf:
+    """
+    Insert several spanners at once.
+
+    This is equivalent to chaining one `tab_spanner()` call for each entry of `specs`, but the
+    table is only copied once, after all of the spanners have been added. This is useful when
+    adding many spanners to a table.
+
+    Parameters
+    ----------
+    specs : list[dict[str, Any]]
+        The spanners to insert, in order. Each entry is a dictionary of the arguments that would be
+        passed to `tab_spanner()` (e.g., `dict(label="performance", columns=["hp", "trq"])`).
+        Arguments not present in an entry take the same defaults as in `tab_spanner()`.
+
+    Returns
+    -------
+    GT
+        The GT object is returned. This is the same object that the method is called on so that we
+        can facilitate method chaining.
+
+    Examples
+    --------
+    Using a small portion of the `gtcars` dataset, we'll add a `"performance"` spanner over several
+    columns and a `"fuel economy"` spanner over two others, in a single call.
+
+    ```{python}
+    import great_tables as gt
+
+    colnames = [\"model\", \"hp\", \"hp_rpm\", \"trq\", \"trq_rpm\", \"mpg_c\", \"mpg_h\"]
+    gtcars_mini = gt.data.gtcars[colnames].head(10)
+
+    (
+        gt.GT(gtcars_mini)
+        .tab_spanners_batch(
+            [
+                dict(label=\"performance\", columns=[\"hp\", \"hp_rpm\", \"trq\", \"trq_rpm\"]),
+                dict(label=\"fuel economy\", columns=[\"mpg_c\", \"mpg_h\"]),
+            ]
+        )
+    )
+    ```
+    """
+
+    crnt_spanners = data._spanners
+    crnt_boxhead = data._boxhead
+
+    for spec in specs:
+        crnt_spanners, crnt_boxhead = _add_spanner(data, crnt_spanners, crnt_boxhead, **spec)
+
+    if crnt_spanners is data._spanners:
+        return data
+
+    return data._replace(_spanners=crnt_spanners, _boxhead=crnt_boxhead)
+
+
+def _add_spanner(
+    data: GTSelf,
+    crnt_spanners: Spanners,
+    crnt_boxhead: Boxhead,
+    label: str,
+    columns: SelectExpr = None,
+    spanners: Union[list[str], str, None] = None,
+    level: Optional[int] = None,
+    id: Optional[str] = None,
+    gather: bool = True,
+    replace: bool = False,
+) -> tuple[Spanners, Boxhead]:
+    """Add a spanner as tab_spanner() does, returning the new spanners and boxhead."""
+
+    # TODO: replace is unimplemented
+
+    if isinstance(spanners, (str, int)):
+        spanners = [spanners]
+
+    new_span = _new_spanner_info(
+        data, crnt_spanners, label=label, columns=columns, spanners=spanners, level=level, id=id
+    )
+
+    if new_span is None:
+        return crnt_spanners, crnt_boxhead
+
+    new_spanners = crnt_spanners.append_entry(new_span)
+
+    if gather and not spanners and new_span.spanner_level == 0:
+        return new_spanners, _gather_columns(crnt_boxhead, new_span.vars)
+
+    return new_spanners, crnt_boxhead
+
+
+def _new_spanner_info(
+    data: GTSelf,
+    crnt_spanners: Spanners,
+    label: str,
+    columns: SelectExpr = None,
+    spanners: Optional[list[str]] = None,
+    level: Optional[int] = None,
+    id: Optional[str] = None,
+) -> Optional[SpannerInfo]:
+    """Create the SpannerInfo that tab_spanner() adds, or None when nothing is selected."""
+
+    crnt_spanner_ids = [span.spanner_id for span in crnt_spanners]
 
     if id is None:
         id = label
@@ -125,9 +239,6 @@ def tab_spanner(
     if isinstance(columns, (str, int)):
         columns = [columns]
 
-    if isinstance(spanners, (str, int)):
-        spanners = [spanners]
-
     # validations ----
     if level is not None and level < 0:
         raise ValueError(f"Level may not be negative. Received {level}.")
@@ -152,10 +263,10 @@ def tab_spanner(
         spanner_ids = []
 
     if not len(selected_column_names) and not len(spanner_ids):
-        return data
+        return None
 
     # get column names associated with selected spanners ----
-    _vars = [span.vars for span in data._spanners if span.spanner_id in spanner_ids]
+    _vars = [span.vars for span in crnt_spanners if span.spanner_id in spanner_ids]
     spanner_column_names = list({k: True for k in itertools.chain(*_vars)})
 
     column_names = list({k: True for k in [*selected_column_names, *spanner_column_names]})
@@ -164,14 +275,14 @@ def tab_spanner(
 
     # get spanner level ----
     if level is None:
-        level = data._spanners.next_level(column_names)
+        level = crnt_spanners.next_level(column_names)
 
     # get spanner units and labels ----
     # TODO: grep units from {{.*}}, may need to switch delimiters
     spanner_units = None
     spanner_pattern = None
 
-    new_span = SpannerInfo(
+    return SpannerInfo(
         spanner_id=id,
         spanner_level=level,
         vars=column_names,
@@ -180,14 +291,25 @@ def tab_spanner(
         spanner_label=label,
     )
 
-    spanners = data._spanners.append_entry(new_span)
 
-    new_data = data._replace(_spanners=spanners)
+def _gather_columns(boxhead: Boxhead, column_names: list[str]) -> Boxhead:
+    """Move columns so they directly follow the first of them, as cols_move() would."""
+
+    var_index = boxhead.var_index()
+    after = column_names[0]
+    moving_idx = [var_index[var] for var in column_names[1:]]
+    moving_set = set(moving_idx)
 
-    if gather and not len(spanner_ids) and level == 0:
-        return cols_move(new_data, columns=column_names, after=column_names[0])
+    # Build the full permutation in one pass, placing the moved columns right after `after`
+    new_order: list[int] = []
+    for ii, col in enumerate(boxhead):
+        if ii in moving_set:
+            continue
+        new_order.append(ii)
+        if col.var == after:
+            new_order.extend(moving_idx)
 
-    return new_data
+    return boxhead[new_order]
 
 
 def cols_move(data: GTSelf, columns: SelectExpr, after: str) -> GTSelf:
@@ -253,6 +375,7 @@ def cols_move(data: GTSelf, columns: SelectExpr, after: str) -> GTSelf:
     sel_after = resolve_cols_c(data=data, expr=[after])
 
     vars = [col.var for col in data._boxhead]
+    var_index = data._boxhead.var_index()
 
     if not len(sel_after):
         raise ValueError(f"Column {after} not found in table.")
@@ -263,11 +386,12 @@ def cols_move(data: GTSelf, columns: SelectExpr, after: str) -> GTSelf:
 
     if not len(sel_cols):
         raise Exception("No columns selected.")
-    elif not all([col in vars for col in sel_cols]):
+    elif not all([col in var_index for col in sel_cols]):
         raise ValueError("All `columns` must exist and be visible in the input `data` table.")
 
     moving_columns = [col for col in sel_cols if col not in sel_after]
-    other_columns = [col for col in vars if col not in moving_columns]
+    moving_set = set(moving_columns)
+    other_columns = [col for col in vars if col not in moving_set]
 
     indx = other_columns.index(after)
     final_vars = [*other_columns[: indx + 1], *moving_columns, *other_columns[indx + 1 :]]
@@ -334,14 +458,16 @@ def cols_move_to_start(data: GTSelf, columns: SelectExpr) -> GTSelf:
     sel_cols = resolve_cols_c(data=data, expr=columns)
 
     vars = [col.var for col in data._boxhead]
+    var_index = data._boxhead.var_index()
 
     if not len(sel_cols):
         raise Exception("No columns selected.")
-    elif not all([col in vars for col in sel_cols]):
+    elif not all([col in var_index for col in sel_cols]):
         raise ValueError("All `columns` must exist and be visible in the input `data` table.")
 
     moving_columns = [col for col in sel_cols]
-    other_columns = [col for col in vars if col not in moving_columns]
+    moving_set = set(moving_columns)
+    other_columns = [col for col in vars if col not in moving_set]
 
     final_vars = [*moving_columns, *other_columns]
 
@@ -401,14 +527,16 @@ def cols_move_to_end(data: GTSelf, columns: SelectExpr) -> GTSelf:
     sel_cols = resolve_cols_c(data=data, expr=columns)
 
     vars = [col.var for col in data._boxhead]
+    var_index = data._boxhead.var_index()
 
     if not len(sel_cols):
         raise Exception("No columns selected.")
-    elif not all([col in vars for col in sel_cols]):
+    elif not all([col in var_index for col in sel_cols]):
         raise ValueError("All `columns` must exist and be visible in the input `data` table.")
 
     moving_columns = [col for col in sel_cols]
-    other_columns = [col for col in vars if col not in moving_columns]
+    moving_set = set(moving_columns)
+    other_columns = [col for col in vars if col not in moving_set]
 
     final_vars = [*other_columns, *moving_columns]
 
@@ -454,11 +582,11 @@ def cols_hide(data: GTSelf, columns: SelectExpr) -> GTSelf:
 
     sel_cols = resolve_cols_c(data=data, expr=columns)
 
-    vars = [col.var for col in data._boxhead]
+    var_index = data._boxhead.var_index()
 
     if not len(sel_cols):
         raise Exception("No columns selected.")
-    elif not all([col in vars for col in columns]):
+    elif not all([col in var_index for col in columns]):
         raise ValueError("All `columns` must exist and be visible in the input `data` table.")
 
     # New boxhead with hidden columns
@@ -482,45 +610,45 @@ def spanners_print_matrix(
     if not spanners:
         return empty_spanner_matrix(vars=vars, omit_columns_row=omit_columns_row)
 
-    # Modify `spanners_tbl` such that:
-    # (1) only visible vars are included in the `vars` column
-    # (2) entries with no vars (after step 1) are removed, and
+    # Fill the matrix in a single pass over the spanners, such that:
+    # (1) only visible vars are included in the matrix
+    # (2) entries with no vars (after step 1) are skipped, and
     # (3) `spanner_level` values have all gaps removed, being compressed
-    #     down to start at 1 (e.g., 7, 5, 3, 1 -> 4, 3, 2, 1)
-    _vars = [set(span.vars) & set(vars) for span in spanners]
+    #     down to start at 0 (e.g., 7, 5, 3, 1 -> 3, 2, 1, 0)
     _lvls = sorted({span.spanner_level for span in spanners})
+    lvl_to_idx = {lvl: ii for ii, lvl in enumerate(_lvls)}
 
-    non_empty_spans = [span for crnt_vars, span in zip(_vars, spanners) if len(crnt_vars)]
-    new_levels = [_lvls.index(span.spanner_level) for span in non_empty_spans]
+    # Create a matrix with dimension spanner_height x vars (e.g. presented columns).
+    # Each row is a list indexed by the position of its column in `vars`.
+    var_to_idx = {var: ii for ii, var in enumerate(vars)}
+    label_matrix: SpannerMatrix = [[None] * len(vars) for _ in range(len(_lvls))]
 
-    crnt_spans = Spanners(non_empty_spans).relevel(new_levels)
+    n_spans = 0
+    for span in spanners:
+        # This skips spanned columns that are not in the boxhead vars we
+        # are planning to use (e.g. not in the visible ones or in the stub).
+        var_idxs = [var_to_idx[var] for var in span.vars if var in var_to_idx]
+        if not var_idxs:
+            continue
 
-    if not crnt_spans:
-        return empty_spanner_matrix(vars=vars, omit_columns_row=omit_columns_row)
+        # TODO: span.built can be None. When does it get set?
+        span_repr = span.spanner_id if ids else span.built_label()
 
-    spanner_height = len(_lvls)
-    # TODO: span.built can be None. When does it get set?
-    spanner_reprs = [span.spanner_id if ids else span.built_label() for span in crnt_spans]
+        level_row = label_matrix[lvl_to_idx[span.spanner_level]]
+        for var_idx in var_idxs:
+            level_row[var_idx] = span_repr
 
-    # Create a matrix with dimension spanner_height x vars (e.g. presented columns)
-    label_matrix: SpannerMatrix = [
-        {var_name: None for var_name in vars} for _ in range(spanner_height)
-    ]
+        n_spans += 1
 
-    for span_ii, span in enumerate(crnt_spans):
-        for var in span.vars:
-            # This if clause skips spanned columns that are not in the
-            # boxhead vars we are planning to use (e.g. not in the visible ones
-            # or in the stub).
-            if var in label_matrix[span.spanner_level]:
-                label_matrix[span.spanner_level][var] = spanner_reprs[span_ii]
+    if not n_spans:
+        return empty_spanner_matrix(vars=vars, omit_columns_row=omit_columns_row)
 
     # reverse order , so if you were to print it out, level 0 would appear on the bottom
     label_matrix.reverse()
 
     # add column names to matrix
     if not omit_columns_row:
-        label_matrix.append({var: var for var in vars})
+        label_matrix.append(list(vars))
 
     return label_matrix, vars
 
@@ -531,30 +659,20 @@ def empty_spanner_matrix(
     if omit_columns_row:
         return [], vars
 
-    return [{var: var for var in vars}], vars
+    return [list(vars)], vars
 
 
 def seq_groups(seq: list[str]):
     # TODO: 0-length sequence
     if len(seq) == 0:
         raise StopIteration
-    elif len(seq) == 1:
-        yield seq[0], 1
-    else:
-        crnt_ttl = 1
-        for crnt_el, next_el in zip(seq[:-1], seq[1:]):
-            if is_equal(crnt_el, next_el):
-                crnt_ttl += 1
-            else:
-                yield crnt_el, crnt_ttl
-                crnt_ttl = 1
-
-        # final step has same elements, so we need to yield one last time
-        if is_equal(crnt_el, next_el):
-            yield crnt_el, crnt_ttl
-        else:
-            yield next_el, 1
 
-
-def is_equal(x: Any, y: Any) -> bool:
-    return x is not None and x == y
+    # groupby does the run-length encoding in C. Missing values (None or NaN) never
+    # group together, so their runs are split into runs of 1. This also covers a
+    # repeated NaN object, which groupby would otherwise merge by identity.
+    for key, grp in itertools.groupby(seq):
+        n = sum(1 for _ in grp)
+        if key is None or key != key:
+            yield from itertools.repeat((key, 1), n)
+        else:
+            yield key, n
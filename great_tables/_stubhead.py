@@ -53,4 +53,8 @@ def tab_stubhead(self: GTSelf, label: Union[str, Text]) -> GTSelf:
     ```
     """
 
+    # labels are immutable, so setting the same label again is a no-op
+    if label is self._stubhead or (isinstance(label, str) and label == self._stubhead):
+        return self
+
     return self._replace(_stubhead=label)
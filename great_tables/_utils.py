@@ -2,6 +2,7 @@ from typing import Optional, Union, List, Any
 import pandas as pd
 import json
 import re
+import sys
 
 
 def heading_has_title(title: Optional[str]) -> bool:
@@ -12,6 +13,11 @@ def heading_has_subtitle(subtitle: Optional[str]) -> bool:
     return subtitle is not None
 
 
+def _intern_str(x: Any) -> Any:
+    # Column names are compared and hashed often; interning makes equal names the same object
+    return sys.intern(x) if type(x) is str else x
+
+
 def _match_arg(x: str, lst: List[str]) -> str:
     # Ensure that `lst` has at least one element
     if len(lst) == 0:
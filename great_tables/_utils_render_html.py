@@ -206,7 +206,7 @@ def create_columns_component_h(data: GTData) -> str:
         # NOTE: Run-length encoding treats missing values as distinct from each other; in other
         # words, each missing value starts a new run of length 1
 
-        spanner_ids_level_1_index = list(spanner_ids[level_1_index].values())
+        spanner_ids_level_1_index = list(spanner_ids[level_1_index])
         spanners_rle = list(seq_groups(seq=list(spanner_ids_level_1_index)))
 
         # `colspans` matches `spanners` in length; each element is the number of columns that the
@@ -215,8 +215,8 @@ def create_columns_component_h(data: GTData) -> str:
 
         colspans = list(chain(*group_spans))
 
-        for ii, (span_key, h_info) in enumerate(zip(spanner_col_names, headings_info)):
-            if spanner_ids[level_1_index][span_key] is None:
+        for ii, h_info in enumerate(headings_info):
+            if spanner_ids_level_1_index[ii] is None:
                 # NOTE: Ignore styles for now
                 # styles_heading = filter(
                 #     lambda x: x.get('locname') == "columns_columns" and x.get('colname') == headings_vars[i],
@@ -242,7 +242,7 @@ def create_columns_component_h(data: GTData) -> str:
                     )
                 )
 
-            elif spanner_ids[level_1_index][span_key] is not None:
+            elif spanner_ids_level_1_index[ii] is not None:
                 # If colspans[i] == 0, it means that a previous cell's
                 # `colspan` will cover us
                 if colspans[ii] > 0:
@@ -277,7 +277,9 @@ def create_columns_component_h(data: GTData) -> str:
                         )
                     )
 
-        remaining_headings = [k for k, v in spanner_ids[level_1_index].items() if v is not None]
+        remaining_headings = [
+            k for k, v in zip(spanner_col_names, spanner_ids_level_1_index) if v is not None
+        ]
         remaining_headings_labels = [
             entry.column_label for entry in boxhead if entry.var in remaining_headings
         ]
@@ -358,7 +360,7 @@ def create_columns_component_h(data: GTData) -> str:
 
             level_i_spanners = []
 
-            for colspan, span_label in zip(colspans, spanners_row.values()):
+            for colspan, span_label in zip(colspans, spanners_row):
                 if colspan > 0:
                     # Skip styles for now
                     # styles_spanners = styles_tbl[
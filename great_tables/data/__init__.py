@@ -1,6 +1,9 @@
 import pandas as pd
 import pkg_resources
 
+# Each dataset below is read once, when this module is imported, and every access returns that
+# same DataFrame. They should be treated as read-only: copy a dataset before modifying it in place.
+
 DATA_MOD = "great_tables.data"
 
 _countrypops_fname = pkg_resources.resource_filename(DATA_MOD, "01-countrypops.csv")
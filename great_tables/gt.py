@@ -36,6 +36,7 @@ from great_tables._options import (
 from great_tables._source_notes import tab_source_note
 from great_tables._spanners import (
     tab_spanner,
+    tab_spanners_batch,
     cols_move,
     cols_move_to_start,
     cols_move_to_end,
@@ -215,6 +216,7 @@ class GT(
     tab_header = tab_header
 
     tab_spanner = tab_spanner
+    tab_spanners_batch = tab_spanners_batch
     tab_source_note = tab_source_note
     cols_move = cols_move
     cols_move_to_start = cols_move_to_start
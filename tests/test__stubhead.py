@@ -18,3 +18,11 @@ def test_tab_stubhead():
     # Test adding a stubhead label with HTML formatting
     result = gt_data.tab_stubhead(label=gt.html("<strong>Car</strong>"))
     assert result._stubhead.text == "<strong>Car</strong>"
+
+
+def test_tab_stubhead_same_label_returns_self():
+    df = pd.DataFrame({"model": ["Toyota", "Honda", "Ford"], "year": [2020, 2021, 2019]})
+    gt_data = gt.GT(df, rowname_col="model").tab_stubhead(label="Car")
+
+    assert gt_data.tab_stubhead(label="Car") is gt_data
+    assert gt_data.tab_stubhead(label="Truck")._stubhead == "Truck"
@@ -19,6 +19,14 @@ def test_gt_replace(gt_tbl: GT):
     new_gt_tbl = gt_tbl._replace(_row_groups=row_groups)
 
     assert new_gt_tbl._row_groups is row_groups
+    assert type(new_gt_tbl) is GT
+    assert new_gt_tbl._boxhead is gt_tbl._boxhead
+    assert gt_tbl._row_groups is not row_groups
+
+
+def test_gt_replace_raises(gt_tbl: GT):
+    with pytest.raises(ValueError):
+        gt_tbl._replace(_not_a_field=1)
 
 
 def test_gt_object_prerender(gt_tbl: GT):
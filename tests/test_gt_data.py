@@ -27,3 +27,10 @@ def test_boxhead_reorder():
     new_boxh = boxh.reorder(["b", "a", "c"])
 
     assert new_boxh == Boxhead([ColInfo("b"), ColInfo("a"), ColInfo("c")])
+
+
+def test_boxhead_var_index():
+    boxh = Boxhead([ColInfo("a"), ColInfo("b"), ColInfo("c")])
+
+    assert boxh.var_index() == {"a": 0, "b": 1, "c": 2}
+    assert boxh.reorder(["c", "b", "a"]).var_index() == {"c": 0, "b": 1, "a": 2}
@@ -7,9 +7,23 @@ from great_tables._spanners import (
     tab_spanner,
     cols_hide,
     cols_move,
+    seq_groups,
 )
 from great_tables._gt_data import Spanners, SpannerInfo, Boxhead, ColInfo, ColInfoTypeEnum
-from great_tables import GT
+from great_tables import GT, exibble
+
+
+# GT() does not modify its input, so the same frames are shared across tests
+@pytest.fixture(scope="session")
+def df():
+    return pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+
+
+@pytest.fixture(scope="session")
+def df_pl():
+    import polars as pl
+
+    return pl.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
 
 
 @pytest.fixture
@@ -50,9 +64,9 @@ def test_spanners_print_matrix(spanners, boxhead):
     mat, vars = spanners_print_matrix(spanners, boxhead)
     assert vars == ["col1", "col2", "col3"]
     assert mat == [
-        {"col1": None, "col2": "B", "col3": None},
-        {"col1": "A", "col2": None, "col3": None},
-        {"col1": "col1", "col2": "col2", "col3": "col3"},
+        [None, "B", None],
+        ["A", None, None],
+        ["col1", "col2", "col3"],
     ]
 
 
@@ -60,8 +74,8 @@ def test_spanners_print_matrix_arg_omit_columns_row(spanners, boxhead):
     mat, vars = spanners_print_matrix(spanners, boxhead, omit_columns_row=True)
     assert vars == ["col1", "col2", "col3"]
     assert mat == [
-        {"col1": None, "col2": "B", "col3": None},
-        {"col1": "A", "col2": None, "col3": None},
+        [None, "B", None],
+        ["A", None, None],
     ]
 
 
@@ -69,9 +83,9 @@ def test_spanners_print_matrix_arg_include_hidden(spanners, boxhead):
     mat, vars = spanners_print_matrix(spanners, boxhead, include_hidden=True)
     assert vars == ["col1", "col2", "col3", "col4"]
     assert mat == [
-        {"col1": None, "col2": "B", "col3": None, "col4": None},
-        {"col1": "A", "col2": None, "col3": None, "col4": None},
-        {"col1": "col1", "col2": "col2", "col3": "col3", "col4": "col4"},
+        [None, "B", None, None],
+        ["A", None, None, None],
+        ["col1", "col2", "col3", "col4"],
     ]
 
 
@@ -83,14 +97,33 @@ def test_spanners_print_matrix_exclude_stub():
 
     mat, vars = spanners_print_matrix(spanners, boxh, omit_columns_row=True)
     assert vars == ["x"]
-    assert mat == [{"x": "A"}]
+    assert mat == [["A"]]
+
+
+def test_spanners_print_matrix_level_gaps(boxhead):
+    """spanners_print_matrix compresses levels and skips spanners over hidden columns only."""
+    spanners = Spanners(
+        [
+            SpannerInfo(spanner_id="a", spanner_level=3, vars=["col1", "col2"], built="A"),
+            SpannerInfo(spanner_id="b", spanner_level=7, vars=["col4"]),
+            SpannerInfo(spanner_id="c", spanner_level=5, vars=["col3", "col4"], built="C"),
+        ]
+    )
+
+    mat, vars = spanners_print_matrix(spanners, boxhead, omit_columns_row=True)
+    assert vars == ["col1", "col2", "col3"]
+    assert mat == [
+        [None, None, None],
+        [None, None, "C"],
+        ["A", "A", None],
+    ]
 
 
 def test_empty_spanner_matrix():
     mat, vars = empty_spanner_matrix(["a", "b"], omit_columns_row=False)
 
     assert vars == ["a", "b"]
-    assert mat == [{"a": "a", "b": "b"}]
+    assert mat == [["a", "b"]]
 
 
 def test_empty_spanner_matrix_arg_omit_columns_row():
@@ -100,8 +133,7 @@ def test_empty_spanner_matrix_arg_omit_columns_row():
     assert mat == []
 
 
-def test_tab_spanners_with_columns():
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+def test_tab_spanners_with_columns(df: pd.DataFrame):
     src_gt = GT(df)
 
     dst_span = SpannerInfo("a_spanner", 0, "a_spanner", vars=["b", "a"])
@@ -111,8 +143,7 @@ def test_tab_spanners_with_columns():
     assert new_gt._spanners[0] == dst_span
 
 
-def test_tab_spanners_with_spanner_ids():
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+def test_tab_spanners_with_spanner_ids(df: pd.DataFrame):
     src_gt = GT(df)
 
     # we'll be testing for this second spanner added
@@ -126,8 +157,7 @@ def test_tab_spanners_with_spanner_ids():
     assert new_gt._spanners[1] == dst_span
 
 
-def test_tab_spanners_overlap():
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+def test_tab_spanners_overlap(df: pd.DataFrame):
     src_gt = GT(df)
 
     # we'll be testing for this second spanner added
@@ -141,8 +171,21 @@ def test_tab_spanners_overlap():
     assert new_gt._spanners[1] == dst_span
 
 
-def test_tab_spanners_with_gather():
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+def test_multiple_spanners_above_one():
+    gt = (
+        GT(exibble, rowname_col="row")
+        .tab_spanner("A", ["num", "char", "fctr"])
+        .tab_spanner("B", ["fctr"])
+        .tab_spanner("C", ["num", "char"])
+        .tab_spanner("D", ["fctr", "date", "time"])
+        .tab_spanner("E", columns=[], spanners=["B", "C"])
+    )
+
+    assert gt._spanners[-1] == SpannerInfo("E", 3, "E", vars=["fctr", "num", "char"])
+    assert [span.spanner_level for span in gt._spanners] == [0, 1, 1, 2, 3]
+
+
+def test_tab_spanners_with_gather(df: pd.DataFrame):
     src_gt = GT(df)
 
     new_gt = tab_spanner(src_gt, "a_spanner", columns=["a", "c"], gather=True)
@@ -151,8 +194,57 @@ def test_tab_spanners_with_gather():
     assert [col.var for col in new_gt._boxhead] == ["a", "c", "b"]
 
 
-def test_cols_hide():
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+def test_tab_spanners_with_gather_keeps_position(df: pd.DataFrame):
+    src_gt = GT(df)
+
+    new_gt = tab_spanner(src_gt, "a_spanner", columns=["c", "a"], gather=True)
+
+    assert [col.var for col in new_gt._boxhead] == ["b", "c", "a"]
+
+
+def test_tab_spanners_batch(df: pd.DataFrame):
+    src_gt = GT(df)
+
+    chained_gt = src_gt.tab_spanner("a_spanner", columns=["a", "c"]).tab_spanner(
+        "b_spanner", columns=["b"], gather=False
+    )
+    chained_gt = chained_gt.tab_spanner(
+        "c_spanner", spanners=["a_spanner", "b_spanner"], columns=[]
+    )
+
+    new_gt = src_gt.tab_spanners_batch(
+        [
+            dict(label="a_spanner", columns=["a", "c"]),
+            dict(label="b_spanner", columns=["b"], gather=False),
+            dict(label="c_spanner", spanners=["a_spanner", "b_spanner"], columns=[]),
+        ],
+    )
+
+    assert new_gt._spanners == chained_gt._spanners
+    assert new_gt._boxhead == chained_gt._boxhead
+    assert [col.var for col in new_gt._boxhead] == ["a", "c", "b"]
+
+
+def test_tab_spanners_batch_no_columns_returns_self(df: pd.DataFrame):
+    src_gt = GT(df)
+
+    assert src_gt.tab_spanners_batch([dict(label="a_spanner", columns=[])]) is src_gt
+    assert src_gt.tab_spanners_batch([]) is src_gt
+
+
+def test_tab_spanners_interns_column_names():
+    import polars as pl
+
+    # polars creates new string objects each time column names are fetched, so
+    # boxhead and spanner vars only share objects if both are interned
+    df = pl.DataFrame({"".join(["col", " a"]): [1, 2], "b": [3, 4]})
+
+    new_gt = tab_spanner(GT(df), "a_spanner", columns=["".join(["col", " a"])])
+
+    assert new_gt._spanners[0].vars[0] is new_gt._boxhead[0].var
+
+
+def test_cols_hide(df: pd.DataFrame):
     src_gt = GT(df)
 
     new_gt = cols_hide(src_gt, columns=["a"])
@@ -162,20 +254,67 @@ def test_cols_hide():
     assert [col.var for col in new_gt._boxhead if col.visible] == ["c"]
 
 
-def test_cols_move():
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+def test_cols_move(df: pd.DataFrame):
     src_gt = GT(df)
 
     new_gt = cols_move(src_gt, columns=["a"], after="b")
     assert [col.var for col in new_gt._boxhead] == ["b", "a", "c"]
 
 
-def test_cols_move_polars():
-    import polars as pl
+def test_cols_move_polars(df_pl):
     import polars.selectors as cs
 
-    df = pl.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
-    src_gt = GT(df)
+    src_gt = GT(df_pl)
 
     new_gt = cols_move(src_gt, columns=cs.starts_with("a"), after="b")
     assert [col.var for col in new_gt._boxhead] == ["b", "a", "c"]
+
+
+@pytest.mark.parametrize(
+    "seq, grouped",
+    [
+        ("a", [("a", 1)]),
+        ("abc", [("a", 1), ("b", 1), ("c", 1)]),
+        ("aabbccd", [("a", 2), ("b", 2), ("c", 2), ("d", 1)]),
+        ("aabbccdd", [("a", 2), ("b", 2), ("c", 2), ("d", 2)]),
+        ("aabbccddd", [("a", 2), ("b", 2), ("c", 2), ("d", 3)]),
+        ("aabbccdddee", [("a", 2), ("b", 2), ("c", 2), ("d", 3), ("e", 2)]),
+        (["a", "a", "b", None, "c"], [("a", 2), ("b", 1), (None, 1), ("c", 1)]),
+        (["a", "a", "b", None, None, "c"], [("a", 2), ("b", 1), (None, 1), (None, 1), ("c", 1)]),
+        ([None, None, None], [(None, 1), (None, 1), (None, 1)]),
+    ],
+)
+def test_seq_groups(seq, grouped):
+    assert list(seq_groups(seq)) == grouped
+
+
+def test_seq_groups_nan():
+    nan = float("nan")
+
+    res = list(seq_groups([nan, nan, "a"]))
+
+    assert [n for _, n in res] == [1, 1, 1]
+    assert res[0][0] is nan and res[1][0] is nan
+
+
+def test_seq_groups_raises():
+    """Calling seq_groups on an empty sequence raises (StopIteration -> RuntimeError)."""
+    with pytest.raises(RuntimeError):
+        list(seq_groups([]))
+
+
+def test_spanners_next_level_after_append(spanners):
+    new_spanners = spanners.append_entry(
+        SpannerInfo(spanner_id="c", spanner_level=2, vars=["col2", "col3"])
+    )
+
+    # warm the level index on the original, then append from it
+    assert spanners.next_level(["col3"]) == 0
+    newer_spanners = spanners.append_entry(
+        SpannerInfo(spanner_id="c", spanner_level=2, vars=["col2", "col3"])
+    )
+
+    assert new_spanners.next_level(["col3"]) == 3
+    assert newer_spanners.next_level(["col1", "col3"]) == 3
+    assert newer_spanners.next_level(["col4"]) == 0
+    assert spanners.next_level(["col3"]) == 0